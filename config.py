@@ -45,6 +45,11 @@ app.config['GITHUB_CLIENT_SECRET'] = os.getenv('GITHUB_CLIENT_SECRET')
 app.config['OKTA_CLIENT_ID'] = os.getenv('OKTA_CLIENT_ID')
 app.config['OKTA_CLIENT_SECRET'] = os.getenv('OKTA_CLIENT_SECRET')
 app.config['OKTA_DOMAIN'] = os.getenv('OKTA_DOMAIN')
+# Zoom meeting topics: optional regex whose "cid" group captures an embedded
+# course ID, e.g. \[(?P<cid>\d{4,})\]. A topic naming the searched course skips
+# the meeting report lookup; every other meeting is still checked by its report.
+# Empty (the default) always checks meeting reports.
+app.config['ZOOM_TOPIC_COURSE_PATTERN'] = os.getenv('ZOOM_TOPIC_COURSE_PATTERN', '')
 
 
 @app.template_filter("datetimeformat")
@@ -17,3 +17,6 @@ logger.addHandler(handler)
 def log(message):
     logger.info(message)
 
+def get_logger(name):
+    """Return a child of the rotating logger that writes to the same file."""
+    return logger.getChild(name)
@@ -0,0 +1,103 @@
+"""
+Pure recording filters for the Zoom handlers.
+
+Nothing here does I/O or touches Flask, so the module can be compiled on its
+own (e.g. with mypyc) if the filter step ever becomes CPU bound.
+"""
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Pattern, Set
+
+WANTED_TYPES = frozenset(("MP4", "TRANSCRIPT"))
+FILE_FIELDS = ("id", "file_type", "recording_type", "download_url")
+_get_file_fields = itemgetter(*FILE_FIELDS)
+
+
+def report_key(recording: Dict) -> Any:
+    """Key a recording's meeting report by meeting ID, or UUID without one."""
+    return recording.get("id") or recording.get("uuid")
+
+
+def _file_info(f: Dict) -> Dict:
+    try:
+        return dict(zip(FILE_FIELDS, _get_file_fields(f)))
+    except KeyError:
+        return {field: f.get(field) for field in FILE_FIELDS}
+
+
+def build_recording_info(recording: Dict) -> Dict:
+    """Trim a Zoom recording down to the fields and files the API returns."""
+    return {
+        "id": recording.get("id"),
+        "uuid": recording.get("uuid"),
+        "topic": recording.get("topic"),
+        "start_time": recording.get("start_time"),
+        "duration": recording.get("duration"),
+        "recording_files": [
+            _file_info(f)
+            for f in recording.get("recording_files", [])
+            if f.get("file_type") in WANTED_TYPES
+        ],
+    }
+
+
+def canvas_course_value(meeting_report: Dict) -> Any:
+    """Return the raw "Canvas Course" tracking field value from a meeting report."""
+    tf_map = {
+        field.get("field"): field.get("value")
+        for field in meeting_report.get("tracking_fields", [])
+    }
+    return tf_map.get("Canvas Course")
+
+
+def course_matches(value: Any, course_id_str: str, course_id_int: Optional[int]) -> bool:
+    """Compare a tracking field value to the course ID without converting strings."""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return value == course_id_str
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value == course_id_int
+    return str(value) == course_id_str
+
+
+def topic_course_ids(topic: Optional[str], pattern: Optional[Pattern]) -> Set[str]:
+    """Return the course IDs a topic pattern finds in a meeting topic."""
+    if not topic or pattern is None:
+        return set()
+    if "cid" in pattern.groupindex:
+        return {m.group("cid") for m in pattern.finditer(topic)}
+    return {m.group(0) for m in pattern.finditer(topic)}
+
+
+def filter_recordings(
+    all_recordings: List[Dict],
+    reports: Dict[Any, Dict],
+    course_id: Optional[str],
+    topic_pattern: Optional[Pattern] = None,
+) -> List[Dict]:
+    """
+    Return recording info for the recordings that belong to course_id, in order.
+    A recording with a report (keyed by report_key) is matched on its Canvas
+    Course tracking field; one without is matched on course IDs in its topic.
+    With no course_id every recording is returned.
+    """
+    if course_id is None:
+        return [build_recording_info(recording) for recording in all_recordings]
+
+    course_id_str = str(course_id)
+    course_id_int = int(course_id_str) if course_id_str.isdecimal() else None
+
+    filtered = []
+    for recording in all_recordings:
+        meeting_report = reports.get(report_key(recording))
+        if meeting_report is not None:
+            matched = course_matches(
+                canvas_course_value(meeting_report), course_id_str, course_id_int
+            )
+        else:
+            matched = course_id_str in topic_course_ids(
+                recording.get("topic"), topic_pattern
+            )
+        if matched:
+            filtered.append(build_recording_info(recording))
+    return filtered
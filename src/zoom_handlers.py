@@ -1,38 +1,174 @@
 from config import app
-from flask import json, request, abort, jsonify
+from flask import Response, request, abort, jsonify, stream_with_context
 from src.models import ZoomClientConfig
+from src.zoom_filters import filter_recordings, report_key, topic_course_ids
 import src.logger as logger
+import asyncio
+import httpx
+from contextlib import asynccontextmanager
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
-from typing import Dict, List, Optional
+from urllib3.util.retry import Retry
+from cachetools import TTLCache
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from datetime import datetime, timezone, timedelta
+import hmac
+import orjson
 import re
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+
+
+json_loads = orjson.loads
+
+
+def _json_response(payload) -> Response:
+    """Encode a (possibly large) payload with orjson instead of Flask's encoder."""
+    return Response(orjson.dumps(payload), mimetype="application/json")
+
+
+# Retry policy shared by the sync and async Zoom clients
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (429, 502, 503, 504)
+# Seconds before a Zoom call gives up; also bounds urllib3's retry waits,
+# which ignore Retry-After so a long 429 hint can't park a worker
+HTTP_TIMEOUT = 30.0
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled, keep-alive session for talking to Zoom."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Per-meeting messages go through this child of the rotating log at DEBUG, so
+# they cost nothing unless the level is lowered
+log = logger.get_logger("zoom")
+
+# Shared session for token requests so repeated mints reuse the connection
+_token_session = _build_session()
+
+
+# Zoom config rarely changes; cache it briefly to avoid a DB hit per call
+CONFIG_CACHE_TTL = 60
+_config_cache = {"value": None, "expires": 0}
+
+# Access tokens keyed by (account_id, client_id) so they outlive any one client
+_token_cache = {}
+
+# Refresh tokens this long before Zoom says they expire
+TOKEN_EXPIRY_MARGIN = timedelta(seconds=60)
+
+
+def _get_cached_config(ttl: int = CONFIG_CACHE_TTL):
+    """Return the Zoom client config, reading the database at most once per ttl seconds."""
+    now = time.monotonic()
+    if _config_cache["value"] is not None and now < _config_cache["expires"]:
+        return _config_cache["value"]
+
+    with app.app_context():
+        config = ZoomClientConfig.query.first()
+    _config_cache.update(value=config, expires=now + ttl)
+    return config
+
+
+def invalidate_config_cache():
+    """Drop the cached Zoom config so the next read sees admin changes."""
+    _config_cache.update(value=None, expires=0)
 
 
 class ZoomOAuth:
     TOKEN_URL = "https://zoom.us/oauth/token"
 
     def __init__(self):
-        self.config = self.get_config()
-        self.access_token = None
-        self.token_expiry = None
+        # Concurrent callers that miss the token cache wait on one in-flight refresh
+        self._refresh_lock = threading.Lock()
+        self._refresh_future: Optional[Future] = None
+        self._cache_key = None
 
     @staticmethod
     def get_config():
-        return ZoomClientConfig.query.first()
+        return _get_cached_config()
 
-    def get_access_token(self):
-        if (
-            self.access_token
-            and self.token_expiry
-            and datetime.now() < self.token_expiry
-        ):
-            return self.access_token
+    @staticmethod
+    def _cached_token(cache_key):
+        cached = _token_cache.get(cache_key)
+        if cached and datetime.now(timezone.utc) < cached[1]:
+            return cached[0]
+        return None
 
+    def get_access_token(self):
         config = self.get_config()
         if not config:
             raise ValueError("Zoom client configuration not found in the database")
 
+        cache_key = self._cache_key = (config.zoom_account_id, config.zoom_client_id)
+        access_token = self._cached_token(cache_key)
+        if access_token:
+            return access_token
+
+        with self._refresh_lock:
+            # Another thread may have finished a refresh while we waited
+            access_token = self._cached_token(cache_key)
+            if access_token:
+                return access_token
+            future = self._refresh_future
+            is_owner = future is None
+            if is_owner:
+                future = self._refresh_future = Future()
+
+        if not is_owner:
+            # Bounded so a stalled token endpoint fails waiters instead of
+            # parking every request thread behind the owner
+            return future.result(timeout=HTTP_TIMEOUT)
+
+        try:
+            access_token = self._request_token(config, cache_key)
+            future.set_result(access_token)
+            return access_token
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._refresh_lock:
+                self._refresh_future = None
+
+    def cached_access_token(self) -> Optional[str]:
+        """
+        Return the last token this client used if it is still valid. Unlike
+        get_access_token this never reads the config or calls Zoom, so it is
+        safe to call from the event loop.
+        """
+        if self._cache_key is None:
+            return None
+        return self._cached_token(self._cache_key)
+
+    def _request_token(self, config, cache_key):
         data = {
             "grant_type": "account_credentials",
             "account_id": config.zoom_account_id,
@@ -41,16 +177,21 @@ class ZoomOAuth:
         }
 
         try:
-            response = requests.post(self.TOKEN_URL, data=data)
+            response = _token_session.post(
+                self.TOKEN_URL, data=data, timeout=HTTP_TIMEOUT
+            )
             response.raise_for_status()
-            token_data = response.json()
+            token_data = json_loads(response.content)
 
-            self.access_token = token_data["access_token"]
-            self.token_expiry = datetime.now() + timedelta(
-                seconds=token_data["expires_in"]
+            access_token = token_data["access_token"]
+            token_expiry = (
+                datetime.now(timezone.utc)
+                + timedelta(seconds=token_data["expires_in"])
+                - TOKEN_EXPIRY_MARGIN
             )
+            _token_cache[cache_key] = (access_token, token_expiry)
 
-            return self.access_token
+            return access_token
         except HTTPError as http_err:
             if response.status_code == 400:
                 error_message = "Failed to obtain Zoom access token. Please check your Zoom credentials."
@@ -59,18 +200,62 @@ class ZoomOAuth:
             raise
 
 
+def _raise_for_zoom_status(response):
+    """
+    Raise for an HTTP error response, attaching Zoom's error code from the body
+    as zoom_code so callers don't have to parse it again.
+    """
+    try:
+        response.raise_for_status()
+    except (HTTPError, httpx.HTTPStatusError) as e:
+        try:
+            e.zoom_code = json_loads(response.content).get("code")
+        except (ValueError, AttributeError):
+            e.zoom_code = None
+        raise
+
+
 class ZoomClient:
     BASE_URL = "https://api.zoom.us/v2"
 
     def __init__(self):
         self.oauth = ZoomOAuth()
+        self.session = _build_session()
+        # One refresh lock per event loop; each instructor search runs its own
+        self._async_refresh_locks = weakref.WeakKeyDictionary()
 
-    def _get_headers(self):
+    @staticmethod
+    def _headers_for(access_token: str) -> Dict:
         return {
-            "Authorization": f"Bearer {self.oauth.get_access_token()}",
+            "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
         }
 
+    def _get_headers(self):
+        return self._headers_for(self.oauth.get_access_token())
+
+    async def _get_headers_async(self) -> Dict:
+        # A cache miss means a config read and a token POST; run those on a
+        # worker thread rather than blocking every request on the loop
+        access_token = self.oauth.cached_access_token()
+        if access_token is None:
+            async with self._async_refresh_lock():
+                # Another coroutine may have refreshed while we waited
+                access_token = self.oauth.cached_access_token()
+                if access_token is None:
+                    loop = asyncio.get_running_loop()
+                    access_token = await loop.run_in_executor(
+                        None, self.oauth.get_access_token
+                    )
+        return self._headers_for(access_token)
+
+    def _async_refresh_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock = self._async_refresh_locks.get(loop)
+        if lock is None:
+            lock = self._async_refresh_locks[loop] = asyncio.Lock()
+        return lock
+
     def _make_request(
         self,
         method: str,
@@ -79,41 +264,102 @@ class ZoomClient:
         data: Optional[Dict] = None,
     ) -> Dict:
         url = f"{self.BASE_URL}/{endpoint}"
-        response = requests.request(
-            method, url, headers=self._get_headers(), params=params, json=data
+        response = self.session.request(
+            method,
+            url,
+            headers=self._get_headers(),
+            params=params,
+            json=data,
+            timeout=HTTP_TIMEOUT,
         )
-        response.raise_for_status()
-        return response.json()
+        _raise_for_zoom_status(response)
+        return json_loads(response.content)
+
+    async def _make_request_async(
+        self,
+        http: httpx.AsyncClient,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        data: Optional[Dict] = None,
+    ) -> Dict:
+        url = f"{self.BASE_URL}/{endpoint}"
+        for attempt in range(RETRY_TOTAL + 1):
+            headers = await self._get_headers_async()
+            response = await http.request(
+                method, url, headers=headers, params=params, json=data
+            )
+            if response.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                break
+            await asyncio.sleep(RETRY_BACKOFF * 2**attempt)
+        _raise_for_zoom_status(response)
+        return json_loads(response.content)
+
+
+def _async_http() -> httpx.AsyncClient:
+    """Create the async HTTP client used for one instructor search."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=32), timeout=httpx.Timeout(HTTP_TIMEOUT)
+    )
+
+
+# Concurrent report lookups per instructor search
+REPORT_CONCURRENCY = 16
+# Concurrent date-window sweeps per instructor search
+WINDOW_CONCURRENCY = 8
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+# Course IDs embedded in meeting topics, per deployment (see config.py)
+_TOPIC_COURSE_RE = (
+    re.compile(app.config["ZOOM_TOPIC_COURSE_PATTERN"])
+    if app.config.get("ZOOM_TOPIC_COURSE_PATTERN")
+    else None
+)
+
+# Meeting reports by meeting ID (or UUID); finished meetings don't change
+_report_cache = TTLCache(maxsize=10_000, ttl=3600)
+_report_cache_lock = threading.Lock()
+
+_zoom_client_singleton = None
+_client_lock = threading.Lock()
 
 
 def get_zoom_client():
+    """Return the process-wide ZoomClient, creating it on first use."""
+    global _zoom_client_singleton
     try:
-        with app.app_context():
-            zoom_config = ZoomClientConfig.query.get(1)
-            if not zoom_config:
-                raise ValueError("Zoom client configuration not found")
-        return ZoomClient()
+        if not _get_cached_config():
+            raise ValueError("Zoom client configuration not found")
+
+        if _zoom_client_singleton is None:
+            with _client_lock:
+                if _zoom_client_singleton is None:
+                    _zoom_client_singleton = ZoomClient()
+        return _zoom_client_singleton
     except Exception as e:
         logger.log(f"Error creating ZoomClient: {str(e)}")
         raise
 
 
 def validate_access_key(apikey, required_scopes=None, request=None):
-    with app.app_context():
-        zoom_config = ZoomClientConfig.query.get(1)
-        if zoom_config and zoom_config.require_access_key:
-            if apikey and apikey == zoom_config.access_key:
-                return {"sub": "zoom_api_user"}
+    zoom_config = _get_cached_config()
+    if zoom_config and zoom_config.require_access_key:
+        if (
+            apikey
+            and zoom_config.access_key
+            and hmac.compare_digest(apikey.encode(), zoom_config.access_key.encode())
+        ):
+            return {"sub": "zoom_api_user"}
     return None
 
 
 def verify_access_key():
-    with app.app_context():
-        zoom_config = ZoomClientConfig.query.get(1)
-        if zoom_config and zoom_config.require_access_key:
-            access_key = request.headers.get("X-Access-Key")
-            if not validate_access_key(access_key):
-                abort(401, description="Invalid or missing Access Key")
+    zoom_config = _get_cached_config()
+    if zoom_config and zoom_config.require_access_key:
+        access_key = request.headers.get("X-Access-Key")
+        if not validate_access_key(access_key):
+            abort(401, description="Invalid or missing Access Key")
 
 
 def get_meeting_recordings(meeting_id: str) -> Dict:
@@ -139,7 +385,7 @@ def get_meeting_transcript(meeting_id: str) -> Dict:
     try:
         verify_access_key()
         client = get_zoom_client()
-        recordings = get_meeting_recordings(meeting_id)
+        recordings = client._make_request("GET", f"meetings/{meeting_id}/recordings")
         recording_files = recordings.get("recording_files", [])
 
         transcript_file = next(
@@ -153,30 +399,297 @@ def get_meeting_transcript(meeting_id: str) -> Dict:
         if not transcript_url:
             return {"transcript": None, "message": "No transcript URL available"}
 
-        transcript_content = get_transcript_content(
-            transcript_url, client.oauth.get_access_token()
+        transcript = get_transcript_content(
+            transcript_url, client.oauth.get_access_token(), session=client.session
         )
-        if not transcript_content:
+        if transcript is None:
             return {
                 "transcript": None,
                 "message": "Failed to retrieve transcript content",
             }
 
-        return {"transcript": json.loads(webvtt_to_json(transcript_content))}
+        return _json_response({"transcript": transcript})
 
     except Exception as e:
         logger.log(f"Error retrieving meeting transcript: {str(e)}")
         return jsonify({"error": "Internal Server Error", "message": str(e)}), 500
 
 
+def _recording_windows(start_date: datetime, end_date: datetime) -> List[tuple]:
+    """
+    Split a date range into calendar-month (from, to) windows, newest first.
+    Zoom limits each recordings query to one month, and month windows don't overlap.
+    """
+    windows = []
+    month_start = end_date.replace(day=1)
+    range_end = end_date
+    while range_end >= start_date:
+        range_start = max(month_start, start_date)
+        windows.append(
+            (range_start.strftime("%Y-%m-%d"), range_end.strftime("%Y-%m-%d"))
+        )
+        range_end = month_start - timedelta(days=1)
+        month_start = range_end.replace(day=1)
+    return windows
+
+
+async def _fetch_window(
+    client: ZoomClient,
+    http: httpx.AsyncClient,
+    limit: asyncio.Semaphore,
+    user_id: str,
+    range_start: str,
+    range_end: str,
+) -> List[Dict]:
+    """Return every recorded meeting for a user within one date window."""
+    meetings = []
+    params = {"page_size": 300, "from": range_start, "to": range_end}
+    async with limit:
+        while True:
+            recordings_response = await client._make_request_async(
+                http, "GET", f"users/{user_id}/recordings", params=params
+            )
+            meetings.extend(recordings_response.get("meetings", []))
+
+            next_page_token = recordings_response.get("next_page_token")
+            if not next_page_token:
+                return meetings
+            params = dict(params, next_page_token=next_page_token)
+
+
+async def _fetch_report(
+    client: ZoomClient,
+    http: httpx.AsyncClient,
+    limit: asyncio.Semaphore,
+    recording: Dict,
+):
+    """
+    Fetch the meeting report for a recording, falling back to its UUID.
+    Returns (recording, report) with report set to None if it could not be fetched.
+    """
+    meeting_id = recording.get("id")
+    uuid = recording.get("uuid", "")
+    topic = recording.get("topic", "No topic")
+
+    async with limit:
+        try:
+            meeting_report = await client._make_request_async(
+                http, "GET", f"report/meetings/{meeting_id}"
+            )
+            log.debug("Checking meeting ID: %s - Topic: %s", meeting_id, topic)
+            return recording, meeting_report
+
+        except httpx.HTTPStatusError as meeting_error:
+            if (
+                meeting_error.response.status_code == 404
+                and getattr(meeting_error, "zoom_code", None) == 3001
+            ):
+                try:
+                    log.debug("Retrying meeting %s with UUID: %s", meeting_id, uuid)
+                    meeting_report = await client._make_request_async(
+                        http, "GET", f"report/meetings/{uuid}"
+                    )
+                    return recording, meeting_report
+                except httpx.HTTPStatusError:
+                    log.warning(
+                        "Failed to get report for meeting %s using both ID and UUID",
+                        meeting_id,
+                    )
+            else:
+                log.warning("Failed to get report for meeting %s", meeting_id)
+
+    return recording, None
+
+
+def _cached_report(recording: Dict) -> Optional[Dict]:
+    with _report_cache_lock:
+        return _report_cache.get(report_key(recording))
+
+
+async def _get_cached_report(
+    client: ZoomClient,
+    http: httpx.AsyncClient,
+    limit: asyncio.Semaphore,
+    recording: Dict,
+) -> Optional[Dict]:
+    """Return the meeting report for a recording, fetching it only on a cache miss."""
+    meeting_report = _cached_report(recording)
+    if meeting_report is None:
+        _, meeting_report = await _fetch_report(client, http, limit, recording)
+        if meeting_report is not None:
+            with _report_cache_lock:
+                _report_cache[report_key(recording)] = meeting_report
+    return meeting_report
+
+
+async def _sweep_recordings(
+    client: ZoomClient, http: httpx.AsyncClient, user_id: str
+) -> List[Dict]:
+    """Return all of a user's recordings, newest first, fetching months concurrently."""
+    windows = _recording_windows(datetime(2020, 1, 1), datetime.now())
+    limit = asyncio.Semaphore(WINDOW_CONCURRENCY)
+    # gather() keeps the windows, and so the recordings, newest first
+    window_results = await asyncio.gather(
+        *[_fetch_window(client, http, limit, user_id, *window) for window in windows]
+    )
+    all_recordings = [
+        recording for recordings in window_results for recording in recordings
+    ]
+    logger.log(f"Total recordings found before filtering: {len(all_recordings)}")
+    return all_recordings
+
+
+def _split_by_report_need(recordings: List[Dict], course_id: str):
+    """
+    Split recordings into those decidable without a network call, either from
+    a cached report or course_id in the topic, and those needing a report.
+    A topic naming some other course ID is not enough to exclude a recording.
+    Returns (reports, decided, pending).
+    """
+    course_id_str = str(course_id)
+    reports = {}
+    decided = []
+    pending = []
+    for recording in recordings:
+        meeting_report = _cached_report(recording)
+        if meeting_report is not None:
+            reports[report_key(recording)] = meeting_report
+            decided.append(recording)
+        elif course_id_str in topic_course_ids(recording.get("topic"), _TOPIC_COURSE_RE):
+            log.debug("Matched meeting %s by its topic", recording.get("id"))
+            decided.append(recording)
+        else:
+            pending.append(recording)
+    return reports, decided, pending
+
+
+async def _iter_reports(
+    client: ZoomClient, http: httpx.AsyncClient, recordings: List[Dict]
+) -> AsyncIterator[Tuple[Dict, Dict]]:
+    """Yield (recording, report) pairs as report lookups complete."""
+    limit = asyncio.Semaphore(REPORT_CONCURRENCY)
+
+    async def fetch(recording):
+        return recording, await _get_cached_report(client, http, limit, recording)
+
+    tasks = [asyncio.ensure_future(fetch(recording)) for recording in recordings]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            recording, meeting_report = await next_done
+            if meeting_report is not None:
+                yield recording, meeting_report
+    finally:
+        # Stop outstanding report lookups if the consumer goes away early
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@asynccontextmanager
+async def _aclosing(agen):
+    """contextlib.aclosing, which Python 3.8 lacks: aclose agen on exit."""
+    try:
+        yield agen
+    finally:
+        await agen.aclose()
+
+
+async def _fetch_recordings_async(
+    client: ZoomClient, user_id: str, course_id: Optional[str]
+) -> List[Dict]:
+    """Return recording info for the user's recordings in course_id, newest first."""
+    reports = {}
+    async with _async_http() as http:
+        all_recordings = await _sweep_recordings(client, http, user_id)
+        if course_id:
+            reports, _, pending = _split_by_report_need(all_recordings, course_id)
+            async with _aclosing(_iter_reports(client, http, pending)) as found:
+                async for recording, meeting_report in found:
+                    reports[report_key(recording)] = meeting_report
+
+    return filter_recordings(all_recordings, reports, course_id, _TOPIC_COURSE_RE)
+
+
+async def _iter_recording_batches(
+    client: ZoomClient, user_id: str, course_id: Optional[str]
+) -> AsyncIterator[List[Dict]]:
+    """
+    Yield recording info for the user's recordings in course_id in batches, as
+    soon as each is decided: first those needing no report, then one per report.
+    """
+    async with _async_http() as http:
+        all_recordings = await _sweep_recordings(client, http, user_id)
+        if not course_id:
+            yield filter_recordings(all_recordings, {}, None)
+            return
+
+        reports, decided, pending = _split_by_report_need(all_recordings, course_id)
+        yield filter_recordings(decided, reports, course_id, _TOPIC_COURSE_RE)
+        async with _aclosing(_iter_reports(client, http, pending)) as found:
+            async for recording, meeting_report in found:
+                yield filter_recordings(
+                    [recording], {report_key(recording): meeting_report}, course_id
+                )
+
+
+def _stream_recordings(
+    client: ZoomClient, user_id: str, course_id: Optional[str]
+) -> Iterator[bytes]:
+    """
+    Yield one JSON-encoded recording per line as soon as each is matched, in
+    completion order. Errors after the stream starts are sent as a final line.
+    """
+    loop = asyncio.new_event_loop()
+    batches = _iter_recording_batches(client, user_id, course_id)
+    count = 0
+    try:
+        while True:
+            try:
+                batch = loop.run_until_complete(batches.__anext__())
+            except StopAsyncIteration:
+                break
+            count += len(batch)
+            for recording_info in batch:
+                yield orjson.dumps(recording_info) + b"\n"
+
+        logger.log(
+            f"Streamed {count} recordings"
+            + (f" matching course ID {course_id}" if course_id else " for instructor")
+        )
+    except Exception as e:
+        logger.log(f"Error streaming instructor recordings: {str(e)}")
+        yield orjson.dumps(
+            {"error": "Internal Server Error", "message": str(e)}
+        ) + b"\n"
+    finally:
+        try:
+            loop.run_until_complete(batches.aclose())
+            # Drain anything still scheduled so no task outlives its loop
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(
+                    asyncio.gather(*pending, return_exceptions=True)
+                )
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
 def get_instructor_recordings(instructor_id: str, course_id: str = None) -> Dict:
     """
     Retrieve all recordings for an instructor filtered by course ID using meeting reports.
     The instructor_id parameter can be either an email or login ID from the LTI launch.
+    Clients that accept application/x-ndjson get one recording per line as they are found.
     """
     try:
         verify_access_key()
         client = get_zoom_client()
+        stream = (
+            request.accept_mimetypes.best_match(["application/json", NDJSON_MIMETYPE])
+            == NDJSON_MIMETYPE
+        )
         logger.log(
             f"Starting recording search for instructor: {instructor_id}"
             + (
@@ -186,161 +699,40 @@ def get_instructor_recordings(instructor_id: str, course_id: str = None) -> Dict
             )
         )
 
-        start_date = datetime(2020, 1, 1)
-        end_date = datetime.now()
-
-        all_recordings = []
-        current_date = end_date
-
-        while current_date >= start_date:
-            range_end = current_date.strftime("%Y-%m-%d")
-            range_start = (current_date - timedelta(days=30)).strftime("%Y-%m-%d")
-
-            try:
-                recordings_response = client._make_request(
-                    "GET",
-                    f"users/{instructor_id}/recordings",
-                    params={"page_size": 300, "from": range_start, "to": range_end},
+        # Resolve the canonical user ID once so every window can use it directly
+        try:
+            user = client._make_request("GET", f"users/{instructor_id}")
+        except HTTPError as e:
+            if e.response.status_code == 404:
+                logger.log(f"No Zoom user found for identifier: {instructor_id}")
+                if stream:
+                    return Response(
+                        orjson.dumps({"message": "No Zoom user found"}) + b"\n",
+                        mimetype=NDJSON_MIMETYPE,
+                    )
+                return _json_response(
+                    {"recordings": [], "message": "No Zoom user found"}
                 )
+            raise
+        user_id = user.get("id") or instructor_id
+        course_id = course_id or None
 
-                recordings = recordings_response.get("meetings", [])
-                # logger.log(
-                #    f"Found {len(recordings)} recordings for date range {range_start} to {range_end}"
-                # )
-                all_recordings.extend(recordings)
-
-            except HTTPError as e:
-                if e.response.status_code == 404:
-                    try:
-                        user = client._make_request("GET", f"users/{instructor_id}")
-                        user_id = user.get("id")
-                        logger.log(f"Retrying with resolved user ID: {user_id}")
-
-                        recordings_response = client._make_request(
-                            "GET",
-                            f"users/{user_id}/recordings",
-                            params={
-                                "page_size": 300,
-                                "from": range_start,
-                                "to": range_end,
-                            },
-                        )
-
-                        recordings = recordings_response.get("meetings", [])
-                        logger.log(
-                            f"Found {len(recordings)} recordings using resolved user ID"
-                        )
-                        all_recordings.extend(recordings)
-
-                    except HTTPError:
-                        logger.log(
-                            f"No Zoom user found for identifier: {instructor_id}"
-                        )
-                        return {"recordings": [], "message": "No Zoom user found"}
-                else:
-                    raise
-
-            current_date = current_date - timedelta(days=30)
-
-        logger.log(f"Total recordings found before filtering: {len(all_recordings)}")
-
-        filtered_recordings = []
-        for recording in all_recordings:
-            meeting_id = recording.get("id")
-            uuid = recording.get("uuid", "")
-            topic = recording.get("topic", "No topic")
-
-            try:
-                meeting_report = client._make_request(
-                    "GET", f"report/meetings/{meeting_id}"
-                )
-                logger.log(f"Checking meeting ID: {meeting_id} - Topic: {topic}")
-
-            except HTTPError as meeting_error:
-                error_response = json.loads(meeting_error.response.text)
-                if (
-                    meeting_error.response.status_code == 404
-                    and error_response.get("code") == 3001
-                ):
-                    try:
-                        logger.log(f"Retrying meeting {meeting_id} with UUID: {uuid}")
-                        meeting_report = client._make_request(
-                            "GET", f"report/meetings/{uuid}"
-                        )
-                    except HTTPError:
-                        logger.log(
-                            f"Failed to get report for meeting {meeting_id} using both ID and UUID"
-                        )
-                        continue
-                else:
-                    logger.log(f"Failed to get report for meeting {meeting_id}")
-                    continue
-
-            # If no course_id specified, include all recordings
-            if not course_id:
-                logger.log(f"Including meeting {meeting_id} (no course filter)")
-                recording_info = {
-                    "id": recording.get("id"),
-                    "uuid": recording.get("uuid"),
-                    "topic": recording.get("topic"),
-                    "start_time": recording.get("start_time"),
-                    "duration": recording.get("duration"),
-                    "recording_files": [
-                        {
-                            "id": f.get("id"),
-                            "file_type": f.get("file_type"),
-                            "recording_type": f.get("recording_type"),
-                            "download_url": f.get("download_url"),
-                        }
-                        for f in recording.get("recording_files", [])
-                        if f.get("file_type") in ["MP4", "TRANSCRIPT"]
-                    ],
-                }
-                filtered_recordings.append(recording_info)
-            else:
-                # Check course ID match
-                tracking_fields = meeting_report.get("tracking_fields", [])
-                canvas_course_field = next(
-                    (
-                        field
-                        for field in tracking_fields
-                        if field.get("field") == "Canvas Course"
-                    ),
-                    None,
-                )
+        if stream:
+            return Response(
+                stream_with_context(_stream_recordings(client, user_id, course_id)),
+                mimetype=NDJSON_MIMETYPE,
+            )
 
-                if canvas_course_field and str(
-                    canvas_course_field.get("value", "")
-                ) == str(course_id):
-                    logger.log(
-                        f"Found matching course ID {course_id} for meeting {meeting_id}"
-                    )
-                    recording_info = {
-                        "id": recording.get("id"),
-                        "uuid": recording.get("uuid"),
-                        "topic": recording.get("topic"),
-                        "start_time": recording.get("start_time"),
-                        "duration": recording.get("duration"),
-                        "recording_files": [
-                            {
-                                "id": f.get("id"),
-                                "file_type": f.get("file_type"),
-                                "recording_type": f.get("recording_type"),
-                                "download_url": f.get("download_url"),
-                            }
-                            for f in recording.get("recording_files", [])
-                            if f.get("file_type") in ["MP4", "TRANSCRIPT"]
-                        ],
-                    }
-                    filtered_recordings.append(recording_info)
-                else:
-                    logger.log(f"No matching course ID for meeting {meeting_id}")
+        filtered_recordings = asyncio.run(
+            _fetch_recordings_async(client, user_id, course_id)
+        )
 
         logger.log(
             f"Found {len(filtered_recordings)} recordings"
             + (f" matching course ID {course_id}" if course_id else " for instructor")
         )
-        return {"recordings": filtered_recordings}
+        # Both content types are in the spec, so connexion needs an explicit one
+        return _json_response({"recordings": filtered_recordings})
 
     except Exception as e:
         logger.log(f"Error retrieving instructor recordings: {str(e)}")
@@ -371,15 +763,16 @@ def get_recording_transcript_by_url(download_url: str) -> Dict:
 
         client = get_zoom_client()
         
-        transcript_content = get_transcript_content(
-            download_url, 
-            client.oauth.get_access_token()
+        transcript = get_transcript_content(
+            download_url,
+            client.oauth.get_access_token(),
+            session=client.session,
         )
 
-        if not transcript_content:
+        if transcript is None:
             return {"transcript": None, "message": "Failed to retrieve transcript"}
 
-        return {"transcript": json.loads(webvtt_to_json(transcript_content))}
+        return _json_response({"transcript": transcript})
 
     except Exception as e:
         logger.log(f"Error retrieving recording transcript: {str(e)}")
@@ -409,14 +802,16 @@ def get_recording_transcript(recording_id: str) -> Dict:
             if not transcript_file:
                 return {"transcript": None, "message": "No transcript available"}
 
-            transcript_content = get_transcript_content(
-                transcript_file["download_url"], client.oauth.get_access_token()
+            transcript = get_transcript_content(
+                transcript_file["download_url"],
+                client.oauth.get_access_token(),
+                session=client.session,
             )
 
-            if not transcript_content:
+            if transcript is None:
                 return {"transcript": None, "message": "Failed to retrieve transcript"}
 
-            return {"transcript": json.loads(webvtt_to_json(transcript_content))}
+            return _json_response({"transcript": transcript})
 
         except HTTPError as e:
             if e.response.status_code == 404:
@@ -428,43 +823,92 @@ def get_recording_transcript(recording_id: str) -> Dict:
         return jsonify({"error": "Internal Server Error", "message": str(e)}), 500
 
 
+# Bytes read per chunk while streaming a transcript download
+TRANSCRIPT_CHUNK_SIZE = 64 * 1024
+
+
 def get_transcript_content(
-    transcript_download_url: str, access_token: str
-) -> Optional[str]:
-    """Download and return the content of the transcript file."""
+    transcript_download_url: str,
+    access_token: str,
+    session: Optional[requests.Session] = None,
+) -> Optional[List[Dict]]:
+    """Download the transcript file and parse it into captions as it streams in."""
     headers = {"Authorization": f"Bearer {access_token}"}
+    http = session or requests
     try:
-        response = requests.get(transcript_download_url, headers=headers)
-        response.raise_for_status()
-        return response.text
+        with http.get(
+            transcript_download_url, headers=headers, stream=True, timeout=HTTP_TIMEOUT
+        ) as response:
+            response.raise_for_status()
+            # Zoom transcripts are UTF-8; setting it skips charset detection
+            response.encoding = "utf-8"
+            return webvtt_to_json(
+                _iter_text_lines(
+                    response.iter_content(
+                        chunk_size=TRANSCRIPT_CHUNK_SIZE, decode_unicode=True
+                    )
+                )
+            )
     except requests.RequestException as e:
         logger.log(f"Error retrieving transcript: {str(e)}")
         return None
 
 
-def webvtt_to_json(webvtt_content: str) -> str:
-    """Convert WebVTT format to JSON."""
-    captions = re.split(r"\r\n\r\n", webvtt_content.strip())
-
-    json_data = []
-
-    for caption in captions:
-        if caption.strip().upper() == "WEBVTT":
+def _iter_text_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Reassemble decoded text chunks into complete lines, each ending in "\n"
+    (a "\r" before it is kept). Unlike requests' iter_lines, a chunk boundary
+    never produces an extra or split line.
+    """
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    if pending:
+        yield pending
+
+
+def _caption(index: Optional[str], timing: str, text_lines: List[str]) -> Dict:
+    start, _, end = timing.partition(" --> ")
+    return {"index": index, "start": start, "end": end, "text": " ".join(text_lines)}
+
+
+def _iter_webvtt_cues(lines: Iterable[str]) -> Iterator[Dict]:
+    """Yield one caption dict per WebVTT cue in a single pass over the lines."""
+    in_header = None
+    index = timing = None
+    text_lines = []
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if in_header is None:
+            # Skip the "WEBVTT" header block when the file has one
+            in_header = line.lstrip("\ufeff").startswith("WEBVTT")
+
+        if not line.strip():
+            if timing is not None and text_lines:
+                yield _caption(index, timing, text_lines)
+            in_header = False
+            index = timing = None
+            text_lines = []
+        elif in_header:
             continue
-
-        lines = caption.split("\r\n")
-        if len(lines) >= 3:
-            index = lines[0]
-            timing = lines[1]
-            text = " ".join(lines[2:])
-
-            try:
-                start, end = timing.split(" --> ")
-            except ValueError:
-                continue
-
-            caption_obj = {"index": index, "start": start, "end": end, "text": text}
-
-            json_data.append(caption_obj)
-
-    return json.dumps(json_data)
+        elif timing is None:
+            if " --> " in line:
+                timing = line
+            elif index is None:
+                index = line
+        else:
+            text_lines.append(line)
+
+    if timing is not None and text_lines:
+        yield _caption(index, timing, text_lines)
+
+
+def webvtt_to_json(webvtt_content: Union[str, Iterable[str]]) -> List[Dict]:
+    """Convert WebVTT content, as a string or an iterable of lines, to a list of captions."""
+    if isinstance(webvtt_content, str):
+        webvtt_content = webvtt_content.splitlines()
+    return list(_iter_webvtt_cues(webvtt_content))
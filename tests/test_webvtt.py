@@ -0,0 +1,134 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.zoom_handlers import _iter_text_lines, get_transcript_content, webvtt_to_json
+
+ZOOM_VTT = (
+    "WEBVTT\r\n"
+    "\r\n"
+    "1\r\n"
+    "00:00:01.000 --> 00:00:02.500\r\n"
+    "Alice: Good morning\r\n"
+    "\r\n"
+    "2\r\n"
+    "00:00:03.000 --> 00:00:05.000\r\n"
+    "Bob: Hello\r\n"
+    "everyone\r\n"
+)
+
+EXPECTED = [
+    {"index": "1", "start": "00:00:01.000", "end": "00:00:02.500", "text": "Alice: Good morning"},
+    {"index": "2", "start": "00:00:03.000", "end": "00:00:05.000", "text": "Bob: Hello everyone"},
+]
+
+
+class TestWebvttToJson(unittest.TestCase):
+
+    def test_crlf_file(self):
+        self.assertEqual(webvtt_to_json(ZOOM_VTT), EXPECTED)
+
+    def test_lf_file(self):
+        self.assertEqual(webvtt_to_json(ZOOM_VTT.replace("\r\n", "\n")), EXPECTED)
+
+    def test_bom_before_header(self):
+        self.assertEqual(webvtt_to_json("\ufeff" + ZOOM_VTT), EXPECTED)
+
+    def test_header_with_metadata_lines(self):
+        content = ZOOM_VTT.replace("WEBVTT\r\n", "WEBVTT - Zoom\r\nKind: captions\r\n", 1)
+        self.assertEqual(webvtt_to_json(content), EXPECTED)
+
+    def test_without_header(self):
+        content = ZOOM_VTT.split("\r\n\r\n", 1)[1]
+        self.assertEqual(webvtt_to_json(content), EXPECTED)
+
+    def test_cues_without_index_line(self):
+        content = (
+            "WEBVTT\n\n"
+            "00:00:01.000 --> 00:00:02.000\n"
+            "First\n\n"
+            "00:00:02.000 --> 00:00:03.000\n"
+            "Second\n"
+        )
+        self.assertEqual(
+            webvtt_to_json(content),
+            [
+                {"index": None, "start": "00:00:01.000", "end": "00:00:02.000", "text": "First"},
+                {"index": None, "start": "00:00:02.000", "end": "00:00:03.000", "text": "Second"},
+            ],
+        )
+
+    def test_multiline_cue_text_is_joined(self):
+        content = "WEBVTT\n\n7\n00:01:00.000 --> 00:01:04.000\none\ntwo\nthree\n"
+        self.assertEqual(webvtt_to_json(content)[0]["text"], "one two three")
+
+    def test_cue_without_text_is_skipped(self):
+        content = "WEBVTT\n\n1\n00:00:01.000 --> 00:00:02.000\n\n2\n00:00:02.000 --> 00:00:03.000\nkept\n"
+        self.assertEqual([c["index"] for c in webvtt_to_json(content)], ["2"])
+
+    def test_iterable_of_lines(self):
+        # Lines as a streaming reader yields them, with their line endings attached
+        lines = ZOOM_VTT.splitlines(keepends=True)
+        self.assertEqual(webvtt_to_json(iter(lines)), EXPECTED)
+
+    def test_iterable_of_lines_without_endings(self):
+        lines = ZOOM_VTT.replace("\r\n", "\n").split("\n")
+        self.assertEqual(webvtt_to_json(iter(lines)), EXPECTED)
+
+    def test_empty_content(self):
+        self.assertEqual(webvtt_to_json(""), [])
+        self.assertEqual(webvtt_to_json("WEBVTT\n"), [])
+
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _long_vtt(cues=300):
+    parts = ["WEBVTT\r\n\r\n"]
+    for i in range(1, cues + 1):
+        parts.append(
+            f"{i}\r\n00:{i // 60:02d}:{i % 60:02d}.000 --> 00:{i // 60:02d}:{i % 60:02d}.900\r\n"
+            f"Speaker {i % 7}: line {i} of the lecture\r\n\r\n"
+        )
+    return "".join(parts)
+
+
+class TestChunkedTranscripts(unittest.TestCase):
+
+    def test_chunk_boundaries_do_not_change_the_parse(self):
+        content = _long_vtt()
+        expected = webvtt_to_json(content)
+        self.assertEqual(len(expected), 300)
+
+        for newline in ("\r\n", "\n"):
+            text = content.replace("\r\n", newline)
+            for size in (1, 2, 3, 7, 64, 511, 512, 4096):
+                with self.subTest(newline=repr(newline), size=size):
+                    parsed = webvtt_to_json(_iter_text_lines(_chunks(text, size)))
+                    self.assertEqual(parsed, expected)
+
+    def test_split_just_before_cue_text(self):
+        text = "WEBVTT\r\n\r\n1\r\n00:00:01.000 --> 00:00:02.000\r\nHello\r\n"
+        split_at = text.index("Hello")
+        parsed = webvtt_to_json(_iter_text_lines([text[:split_at], text[split_at:]]))
+        self.assertEqual([c["text"] for c in parsed], ["Hello"])
+
+    def test_get_transcript_content_streams_chunks_into_parser(self):
+        content = _long_vtt(50)
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = iter(_chunks(content, 512))
+        session = MagicMock()
+        session.get.return_value = response
+
+        transcript = get_transcript_content("https://zoom.us/rec/x", "token", session=session)
+
+        self.assertEqual(transcript, webvtt_to_json(content))
+        self.assertEqual(response.encoding, "utf-8")
+        self.assertTrue(session.get.call_args.kwargs["stream"])
+        self.assertTrue(response.iter_content.call_args.kwargs["decode_unicode"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+from connexion import FlaskApp
+from requests.exceptions import HTTPError
+
+import config
+
+RECORDINGS_URL = "/zoomapi/instructor/recordings"
+NDJSON = "application/x-ndjson"
+
+
+async def _batches(client, user_id, course_id):
+    yield [{"id": 1}]
+    yield [{"id": 2}]
+
+
+class TestInstructorRecordingsApi(unittest.TestCase):
+    """Calls go through the Zoom spec so response content types are checked."""
+
+    @classmethod
+    def setUpClass(cls):
+        api = FlaskApp(__name__, specification_dir=config.basedir / "apispecs")
+        api.add_api("swaggerzoom.yml")
+        cls.http = api.test_client()
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client._make_request.return_value = {"id": "zoom-user"}
+        zoom_config = MagicMock(require_access_key=True, access_key="key")
+        for target, value in (
+            ("_get_cached_config", MagicMock(return_value=zoom_config)),
+            ("get_zoom_client", MagicMock(return_value=self.client)),
+            ("_fetch_recordings_async", AsyncMock(return_value=[{"id": 1}])),
+            ("_iter_recording_batches", _batches),
+        ):
+            patcher = patch(f"src.zoom_handlers.{target}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _get(self, accept=None):
+        headers = {"X-Access-Key": "key"}
+        if accept:
+            headers["Accept"] = accept
+        return self.http.get(
+            RECORDINGS_URL,
+            params={"instructor_id": "teacher@example.edu", "course_id": "12345"},
+            headers=headers,
+        )
+
+    def _no_user(self):
+        error = HTTPError()
+        error.response = MagicMock(status_code=404)
+        self.client._make_request.side_effect = error
+
+    def test_default_accept_returns_json(self):
+        for accept in (None, "*/*", "application/json"):
+            with self.subTest(accept=accept):
+                response = self._get(accept)
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.headers["content-type"], "application/json")
+                self.assertEqual(response.json(), {"recordings": [{"id": 1}]})
+
+    def test_ndjson_accept_streams_lines(self):
+        response = self._get(NDJSON)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], NDJSON)
+        lines = [orjson.loads(line) for line in response.content.splitlines()]
+        self.assertEqual(lines, [{"id": 1}, {"id": 2}])
+
+    def test_unknown_user_json(self):
+        self._no_user()
+
+        response = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/json")
+        self.assertEqual(
+            response.json(), {"recordings": [], "message": "No Zoom user found"}
+        )
+
+    def test_unknown_user_ndjson(self):
+        self._no_user()
+
+        response = self._get(NDJSON)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], NDJSON)
+        self.assertEqual(response.content, b'{"message":"No Zoom user found"}\n')
+
+    def test_missing_access_key_is_rejected(self):
+        response = self.http.get(
+            RECORDINGS_URL, params={"instructor_id": "teacher@example.edu"}
+        )
+
+        self.assertEqual(response.status_code, 401)
+
+
+if __name__ == "__main__":
+    unittest.main()
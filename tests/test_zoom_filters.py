@@ -0,0 +1,159 @@
+import re
+import unittest
+
+from src.zoom_filters import build_recording_info, filter_recordings, topic_course_ids
+
+TOPIC_CID = re.compile(r"\[(?P<cid>\d{4,})\]")
+
+
+def _report(value):
+    return {"tracking_fields": [{"field": "Canvas Course", "value": value}]}
+
+
+class TestFilterRecordings(unittest.TestCase):
+
+    def test_matches_on_report_tracking_field(self):
+        recordings = [{"id": 1}, {"id": 2}, {"id": 3}]
+        reports = {1: _report("12345"), 2: _report("67890"), 3: {"tracking_fields": []}}
+
+        filtered = filter_recordings(recordings, reports, "12345")
+
+        self.assertEqual([r["id"] for r in filtered], [1])
+
+    def test_report_is_keyed_by_uuid_without_an_id(self):
+        recordings = [{"uuid": "abc=="}]
+
+        filtered = filter_recordings(recordings, {"abc==": _report("12345")}, "12345")
+
+        self.assertEqual([r["uuid"] for r in filtered], ["abc=="])
+
+    def test_int_and_str_tracking_values(self):
+        recordings = [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}]
+        reports = {
+            1: _report(12345),
+            2: _report("12345"),
+            3: _report(True),
+            4: _report(12345.0),
+        }
+
+        filtered = filter_recordings(recordings, reports, "12345")
+
+        self.assertEqual([r["id"] for r in filtered], [1, 2])
+
+    def test_int_course_id_matches_str_tracking_value(self):
+        filtered = filter_recordings([{"id": 1}], {1: _report("12345")}, 12345)
+
+        self.assertEqual([r["id"] for r in filtered], [1])
+
+    def test_topic_fallback_without_a_report(self):
+        recordings = [
+            {"id": 1, "topic": "Biology [12345]"},
+            {"id": 2, "topic": "Chemistry [67890]"},
+            {"id": 3, "topic": "Biology [12345]"},
+        ]
+        reports = {3: _report("67890")}
+
+        filtered = filter_recordings(recordings, reports, "12345", TOPIC_CID)
+
+        # The report wins over the topic when both exist
+        self.assertEqual([r["id"] for r in filtered], [1])
+
+    def test_no_report_and_no_pattern_excludes(self):
+        filtered = filter_recordings([{"id": 1, "topic": "Biology [12345]"}], {}, "12345")
+
+        self.assertEqual(filtered, [])
+
+    def test_no_course_id_returns_everything_in_order(self):
+        recordings = [{"id": 3}, {"id": 1}, {"id": 2}]
+
+        filtered = filter_recordings(recordings, {1: _report("12345")}, None)
+
+        self.assertEqual([r["id"] for r in filtered], [3, 1, 2])
+
+    def test_non_decimal_digit_course_id_does_not_raise(self):
+        recordings = [{"id": 1}, {"id": 2}]
+        reports = {1: _report("²"), 2: _report(2)}
+
+        filtered = filter_recordings(recordings, reports, "²")
+
+        self.assertEqual([r["id"] for r in filtered], [1])
+
+
+class TestBuildRecordingInfo(unittest.TestCase):
+
+    def test_keeps_wanted_files_and_fields(self):
+        recording = {
+            "id": 1,
+            "uuid": "u1",
+            "topic": "Lecture",
+            "start_time": "2024-01-01T00:00:00Z",
+            "duration": 60,
+            "host_id": "h",
+            "recording_files": [
+                {
+                    "id": "f1",
+                    "file_type": "MP4",
+                    "recording_type": "shared_screen",
+                    "download_url": "https://zoom.us/rec/f1",
+                    "file_size": 10,
+                },
+                {"id": "f2", "file_type": "M4A"},
+                {
+                    "id": "f3",
+                    "file_type": "TRANSCRIPT",
+                    "recording_type": "audio_transcript",
+                    "download_url": "https://zoom.us/rec/f3",
+                },
+            ],
+        }
+
+        info = build_recording_info(recording)
+
+        self.assertNotIn("host_id", info)
+        self.assertEqual(info["duration"], 60)
+        self.assertEqual([f["id"] for f in info["recording_files"]], ["f1", "f3"])
+        self.assertEqual(
+            info["recording_files"][0],
+            {
+                "id": "f1",
+                "file_type": "MP4",
+                "recording_type": "shared_screen",
+                "download_url": "https://zoom.us/rec/f1",
+            },
+        )
+
+    def test_file_missing_a_key_gets_none(self):
+        recording = {"id": 1, "recording_files": [{"id": "f1", "file_type": "MP4"}]}
+
+        info = build_recording_info(recording)
+
+        self.assertEqual(
+            info["recording_files"],
+            [{"id": "f1", "file_type": "MP4", "recording_type": None, "download_url": None}],
+        )
+        self.assertIsNone(info["topic"])
+
+    def test_recording_without_files(self):
+        self.assertEqual(build_recording_info({"id": 1})["recording_files"], [])
+
+
+class TestTopicCourseIds(unittest.TestCase):
+
+    def test_uses_cid_group(self):
+        ids = topic_course_ids("Biology [12345] / Lab [67890] room 101", TOPIC_CID)
+
+        self.assertEqual(ids, {"12345", "67890"})
+
+    def test_uses_whole_match_without_cid_group(self):
+        ids = topic_course_ids("Biology 12345 room 101", re.compile(r"\d{4,}"))
+
+        self.assertEqual(ids, {"12345"})
+
+    def test_empty_without_topic_or_pattern(self):
+        self.assertEqual(topic_course_ids(None, TOPIC_CID), set())
+        self.assertEqual(topic_course_ids("", TOPIC_CID), set())
+        self.assertEqual(topic_course_ids("Biology [12345]", None), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,367 @@
+import asyncio
+import re
+import threading
+import unittest
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+
+from src.zoom_handlers import (
+    HTTP_TIMEOUT,
+    ZoomClient,
+    ZoomOAuth,
+    _build_session,
+    _fetch_recordings_async,
+    _fetch_report,
+    _report_cache,
+    _fetch_window,
+    _recording_windows,
+    _split_by_report_need,
+    _stream_recordings,
+)
+
+
+class TestRecordingWindows(unittest.TestCase):
+
+    def test_windows_follow_calendar_months_back_to_start(self):
+        windows = _recording_windows(datetime(2020, 1, 1), datetime(2020, 3, 15, 10, 30))
+        self.assertEqual(
+            windows,
+            [
+                ("2020-03-01", "2020-03-15"),
+                ("2020-02-01", "2020-02-29"),
+                ("2020-01-01", "2020-01-31"),
+            ],
+        )
+
+    def test_windows_cross_year_boundary_without_overlap(self):
+        windows = _recording_windows(datetime(2020, 1, 1), datetime(2021, 1, 5))
+        self.assertEqual(windows[0], ("2021-01-01", "2021-01-05"))
+        self.assertEqual(windows[1], ("2020-12-01", "2020-12-31"))
+        self.assertEqual(windows[-1], ("2020-01-01", "2020-01-31"))
+        self.assertEqual(len(windows), 13)
+        # Each window ends the day before the next newer one starts
+        for newer, older in zip(windows, windows[1:]):
+            self.assertLess(older[1], newer[0])
+
+    def test_single_day_range(self):
+        windows = _recording_windows(datetime(2020, 1, 1), datetime(2020, 1, 1))
+        self.assertEqual(windows, [("2020-01-01", "2020-01-01")])
+
+
+class TestFetchWindow(unittest.TestCase):
+
+    def test_follows_next_page_token_until_empty(self):
+        client = MagicMock()
+        client._make_request_async = AsyncMock(
+            side_effect=[
+                {"meetings": [{"id": 1}, {"id": 2}], "next_page_token": "p2"},
+                {"meetings": [{"id": 3}], "next_page_token": "p3"},
+                {"meetings": [{"id": 4}], "next_page_token": ""},
+            ]
+        )
+
+        async def run():
+            return await _fetch_window(
+                client, MagicMock(), asyncio.Semaphore(1), "user", "2020-01-01", "2020-01-31"
+            )
+
+        meetings = asyncio.run(run())
+
+        self.assertEqual([m["id"] for m in meetings], [1, 2, 3, 4])
+        self.assertEqual(client._make_request_async.await_count, 3)
+        params = [call.kwargs["params"] for call in client._make_request_async.await_args_list]
+        self.assertNotIn("next_page_token", params[0])
+        self.assertEqual(params[1]["next_page_token"], "p2")
+        self.assertEqual(params[2]["next_page_token"], "p3")
+        for p in params:
+            self.assertEqual((p["from"], p["to"]), ("2020-01-01", "2020-01-31"))
+
+    def test_single_page_without_token(self):
+        client = MagicMock()
+        client._make_request_async = AsyncMock(return_value={"meetings": [{"id": 1}]})
+
+        async def run():
+            return await _fetch_window(
+                client, MagicMock(), asyncio.Semaphore(1), "user", "a", "b"
+            )
+
+        meetings = asyncio.run(run())
+
+        self.assertEqual(meetings, [{"id": 1}])
+        client._make_request_async.assert_awaited_once()
+
+
+class TestSyncSession(unittest.TestCase):
+
+    def test_retries_ignore_retry_after(self):
+        retry = _build_session().get_adapter("https://api.zoom.us").max_retries
+
+        self.assertFalse(retry.respect_retry_after_header)
+        self.assertIn(429, retry.status_forcelist)
+
+    def test_requests_carry_a_timeout(self):
+        client = ZoomClient()
+        client.oauth = MagicMock()
+        client.oauth.get_access_token.return_value = "token"
+        client.session = MagicMock()
+        client.session.request.return_value.status_code = 200
+        client.session.request.return_value.content = b'{"id": "u"}'
+
+        self.assertEqual(client._make_request("GET", "users/me"), {"id": "u"})
+        self.assertEqual(client.session.request.call_args.kwargs["timeout"], HTTP_TIMEOUT)
+
+
+class TestTokenRefresh(unittest.TestCase):
+
+    def setUp(self):
+        self.config = MagicMock(zoom_account_id="acct-timeout", zoom_client_id="client")
+        patcher = patch.object(ZoomOAuth, "get_config", return_value=self.config)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_token_post_carries_a_timeout(self):
+        with patch("src.zoom_handlers._token_session") as session:
+            session.post.return_value.content = b'{"access_token": "t", "expires_in": 3600}'
+            ZoomOAuth()._request_token(self.config, ("acct-timeout", "post"))
+
+        self.assertEqual(session.post.call_args.kwargs["timeout"], HTTP_TIMEOUT)
+
+    def test_waiter_gives_up_on_a_stalled_refresh(self):
+        oauth = ZoomOAuth()
+        oauth._refresh_future = Future()
+
+        with patch("src.zoom_handlers.HTTP_TIMEOUT", 0.01):
+            with self.assertRaises(FutureTimeoutError):
+                oauth.get_access_token()
+
+
+class TestAsyncHeaders(unittest.TestCase):
+
+    def test_cached_token_skips_refresh(self):
+        client = ZoomClient()
+        client.oauth = MagicMock()
+        client.oauth.cached_access_token.return_value = "cached"
+
+        headers = asyncio.run(client._get_headers_async())
+
+        self.assertEqual(headers["Authorization"], "Bearer cached")
+        client.oauth.get_access_token.assert_not_called()
+
+    def test_refresh_runs_off_the_event_loop_thread(self):
+        client = ZoomClient()
+        client.oauth = MagicMock()
+        client.oauth.cached_access_token.return_value = None
+        refresh_threads = []
+
+        def get_access_token():
+            refresh_threads.append(threading.get_ident())
+            return "fresh"
+
+        client.oauth.get_access_token.side_effect = get_access_token
+
+        async def run():
+            return threading.get_ident(), await client._get_headers_async()
+
+        loop_thread, headers = asyncio.run(run())
+
+        self.assertEqual(headers["Authorization"], "Bearer fresh")
+        self.assertEqual(len(refresh_threads), 1)
+        self.assertNotEqual(refresh_threads[0], loop_thread)
+
+    def test_concurrent_misses_share_one_refresh(self):
+        client = ZoomClient()
+        client.oauth = MagicMock()
+        token = {}
+        client.oauth.cached_access_token.side_effect = lambda: token.get("value")
+
+        def get_access_token():
+            token["value"] = "fresh"
+            return "fresh"
+
+        client.oauth.get_access_token.side_effect = get_access_token
+
+        async def run():
+            return await asyncio.gather(*(client._get_headers_async() for _ in range(10)))
+
+        headers = asyncio.run(run())
+
+        self.assertTrue(all(h["Authorization"] == "Bearer fresh" for h in headers))
+        client.oauth.get_access_token.assert_called_once()
+
+
+def _report(course):
+    return {"tracking_fields": [{"field": "Canvas Course", "value": course}]}
+
+
+def _client():
+    client = ZoomClient()
+    client.oauth = MagicMock()
+    client.oauth.cached_access_token.return_value = "token"
+    return client
+
+
+class TestFetchReport(unittest.TestCase):
+
+    def _fetch(self, handler, recording):
+        paths = []
+
+        def record(request):
+            paths.append(request.url.path)
+            return handler(request)
+
+        async def run():
+            transport = httpx.MockTransport(record)
+            async with httpx.AsyncClient(transport=transport) as http:
+                return await _fetch_report(
+                    _client(), http, asyncio.Semaphore(1), recording
+                )
+
+        return asyncio.run(run()), paths
+
+    def test_falls_back_to_uuid_on_3001(self):
+        def handler(request):
+            if request.url.path.endswith("/report/meetings/1"):
+                return httpx.Response(404, json={"code": 3001, "message": "Not found"})
+            return httpx.Response(200, json=_report("12345"))
+
+        recording = {"id": 1, "uuid": "uuid-1"}
+        (returned, meeting_report), paths = self._fetch(handler, recording)
+
+        self.assertIs(returned, recording)
+        self.assertEqual(meeting_report, _report("12345"))
+        self.assertEqual(
+            paths, ["/v2/report/meetings/1", "/v2/report/meetings/uuid-1"]
+        )
+
+    def test_other_404_does_not_retry_uuid(self):
+        def handler(request):
+            return httpx.Response(404, json={"code": 1001, "message": "No user"})
+
+        (_, meeting_report), paths = self._fetch(handler, {"id": 1, "uuid": "uuid-1"})
+
+        self.assertIsNone(meeting_report)
+        self.assertEqual(paths, ["/v2/report/meetings/1"])
+
+    def test_unreadable_error_body_is_a_failed_fetch(self):
+        def handler(request):
+            return httpx.Response(404, content=b"<html>Not Found</html>")
+
+        (_, meeting_report), paths = self._fetch(handler, {"id": 1, "uuid": "uuid-1"})
+
+        self.assertIsNone(meeting_report)
+        self.assertEqual(paths, ["/v2/report/meetings/1"])
+
+
+class TestReportCache(unittest.TestCase):
+
+    RECORDINGS = [{"id": 1, "uuid": "u1"}, {"id": 2, "uuid": "u2"}, {"id": 3, "uuid": "u3"}]
+    REPORTS = {
+        "/v2/report/meetings/1": _report("11111"),
+        "/v2/report/meetings/2": _report("22222"),
+    }
+
+    def setUp(self):
+        _report_cache.clear()
+        self.addCleanup(_report_cache.clear)
+        self.report_calls = []
+
+        def handler(request):
+            self.report_calls.append(request.url.path)
+            if request.url.path in self.REPORTS:
+                return httpx.Response(200, json=self.REPORTS[request.url.path])
+            return httpx.Response(400, json={"code": 300, "message": "Bad request"})
+
+        transport = httpx.MockTransport(handler)
+        for target, value in (
+            ("_async_http", lambda: httpx.AsyncClient(transport=transport)),
+            ("_sweep_recordings", AsyncMock(return_value=self.RECORDINGS)),
+            ("_TOPIC_COURSE_RE", None),
+        ):
+            patcher = patch(f"src.zoom_handlers.{target}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _search(self, client, course_id):
+        found = asyncio.run(_fetch_recordings_async(client, "user", course_id))
+        return [r["id"] for r in found]
+
+    def test_second_course_reuses_fetched_reports(self):
+        client = _client()
+
+        self.assertEqual(self._search(client, "11111"), [1])
+        self.assertCountEqual(
+            self.report_calls,
+            ["/v2/report/meetings/1", "/v2/report/meetings/2", "/v2/report/meetings/3"],
+        )
+
+        self.report_calls.clear()
+        self.assertEqual(self._search(client, "22222"), [2])
+        # Only the failed lookup is retried; successful reports come from the cache
+        self.assertEqual(self.report_calls, ["/v2/report/meetings/3"])
+
+    def test_failed_fetch_is_not_cached(self):
+        self._search(_client(), "11111")
+
+        self.assertNotIn(3, _report_cache)
+        self.assertIn(1, _report_cache)
+        self.assertIn(2, _report_cache)
+
+
+class TestSplitByReportNeed(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch("src.zoom_handlers._cached_report", return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_only_a_topic_naming_the_course_skips_the_report(self):
+        recordings = [
+            {"id": 1, "topic": "Biology [12345]"},
+            {"id": 2, "topic": "Chemistry [67890]"},
+            {"id": 3, "topic": "Office hours"},
+        ]
+        with patch(
+            "src.zoom_handlers._TOPIC_COURSE_RE", re.compile(r"\[(?P<cid>\d{4,})\]")
+        ):
+            reports, decided, pending = _split_by_report_need(recordings, "12345")
+
+        self.assertEqual(reports, {})
+        self.assertEqual([r["id"] for r in decided], [1])
+        self.assertEqual([r["id"] for r in pending], [2, 3])
+
+    def test_without_a_pattern_every_recording_needs_a_report(self):
+        recordings = [{"id": 1, "topic": "Biology [12345]"}]
+        with patch("src.zoom_handlers._TOPIC_COURSE_RE", None):
+            _, decided, pending = _split_by_report_need(recordings, "12345")
+
+        self.assertEqual(decided, [])
+        self.assertEqual(pending, recordings)
+
+
+class TestStreamRecordings(unittest.TestCase):
+
+    def test_early_close_cleans_up_generators_and_tasks(self):
+        state = {}
+
+        async def batches(client, user_id, course_id):
+            state["task"] = asyncio.ensure_future(asyncio.sleep(3600))
+            try:
+                yield [{"id": 1}]
+                yield [{"id": 2}]
+            finally:
+                state["closed"] = True
+
+        with patch("src.zoom_handlers._iter_recording_batches", batches):
+            stream = _stream_recordings(MagicMock(), "user", "12345")
+            self.assertEqual(next(stream), b'{"id":1}\n')
+            stream.close()
+
+        self.assertTrue(state["closed"])
+        self.assertTrue(state["task"].cancelled())
+
+
+if __name__ == "__main__":
+    unittest.main()
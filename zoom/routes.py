@@ -1,6 +1,7 @@
 from flask import Blueprint, request, render_template, redirect, url_for, flash
 from flask_login import login_required
 from src.models import VendorProxies, ZoomClientConfig, db
+from src.zoom_handlers import invalidate_config_cache
 import secrets
 
 zoom_bp = Blueprint('zoom', __name__, template_folder='templates')
@@ -17,6 +18,7 @@ def zoom_config():
         zoom_config.access_key = secrets.token_urlsafe(32)
         db.session.add(zoom_config)
         db.session.commit()
+        invalidate_config_cache()
     
     if request.method == 'POST':
         action = request.form.get('action')
@@ -27,11 +29,13 @@ def zoom_config():
             zoom_config.zoom_account_id = request.form.get('zoom-account-id')
             zoom_config.require_access_key = 'require-access-key' in request.form
             db.session.commit()
+            invalidate_config_cache()
             flash('Zoom Client config updated', 'success')
         
         elif action == 'regenerate':
             zoom_config.access_key = secrets.token_urlsafe(32)
             db.session.commit()
+            invalidate_config_cache()
             flash('Access Key regenerated', 'success')
         
         return redirect(url_for('zoom.zoom_config'))
@@ -45,6 +49,7 @@ def regenerate_access_key():
     if zoom_config:
         zoom_config.access_key = secrets.token_urlsafe(32)
         db.session.commit()
+        invalidate_config_cache()
         flash('Access Key regenerated', 'success')
     else:
         flash('Zoom configuration not found', 'error')